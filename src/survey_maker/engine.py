@@ -2,7 +2,21 @@
 from pathlib import Path
 from shutil import copy2
 import logging
-from pkgutil import get_data
+import sys
+
+if sys.version_info[:2] >= (3, 9):
+    # TODO: Import directly (no need for conditional) when `python_requires = >= 3.9`
+    from importlib.resources import as_file, files
+
+    def package_file(name):
+        """ Context manager giving the path of the file *name* of the survey_maker package """
+        return as_file(files("survey_maker") / name)
+else:
+    from importlib.resources import path as resource_path
+
+    def package_file(name):
+        """ Context manager giving the path of the file *name* of the survey_maker package """
+        return resource_path("survey_maker", name)
 
 from survey_maker.survey_document import SurveyDocument
 
@@ -20,6 +34,36 @@ __license__ = "mit"
 logger = logging.getLogger(__name__)
 
 
+def style_file_is_current(src_style_file, dest_style_file):
+    """
+    Check if the copy of a style file is still equal to the file in the package
+
+    Parameters
+    ----------
+    src_style_file: Path
+        The style file in the package
+    dest_style_file: Path
+        The copy of the style file in the output directory
+
+    Returns
+    -------
+    bool:
+        True if the copy exists and has the same size and modification time as the package file
+
+    Notes
+    -----
+    The files are copied with *copy2*, which keeps the modification time. An upgrade of the
+    package changes the modification time, so the copy is refreshed without reading the contents
+    """
+    try:
+        dest_stat = dest_style_file.stat()
+    except FileNotFoundError:
+        return False
+    src_stat = src_style_file.stat()
+    return (dest_stat.st_size == src_stat.st_size
+            and dest_stat.st_mtime_ns == src_stat.st_mtime_ns)
+
+
 class SurveyMaker(object):
     """
     Class to create a survey
@@ -65,13 +109,13 @@ class SurveyMaker(object):
 
         for sty_file in TEX_STY_FILES:
             dest_style_file = self.output_directory / sty_file
-            if not dest_style_file.exists():
-                logger.info(f"Copying tex style file {sty_file} to {dest_style_file}")
-                data = get_data("survey_maker", sty_file)
-                with open(dest_style_file, "wb") as fp:
-                    fp.write(data)
-            else:
-                logger.debug("Latex sty {} already present in {}".format(sty_file, dest_style_file))
+            with package_file(sty_file) as src_style_file:
+                if style_file_is_current(src_style_file, dest_style_file):
+                    logger.debug("Latex sty {} already present in {}".format(sty_file,
+                                                                             dest_style_file))
+                else:
+                    logger.info(f"Copying tex style file {sty_file} to {dest_style_file}")
+                    copy2(src_style_file, dest_style_file)
 
         if no_author:
             author = None
@@ -99,6 +143,10 @@ class SurveyMaker(object):
         )
 
         if pdf:
+            if compiler == "latexmk" and n_compile > 1:
+                # latexmk already reruns the compiler until all the labels are resolved
+                logger.warning("Compiling only once as latexmk takes care of the reruns")
+                n_compile = 1
             # create the pdf file for this document
             for cnt in range(n_compile):
                 # in case the --twice comment line option is given, n_compile = 2, such that we
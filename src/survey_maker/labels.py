@@ -1,64 +1,56 @@
 """ Deze module bevat een klasse om alle labels op te slaan """
-LANGUAGES = ("dutch", "english")
+
+# de labels per taal. Iedere taal moet dezelfde sleutels hebben
+LABELS = {
+    "dutch": {
+        "toelichting_vragen": "Toelichting vragen",
+        "toelichting_kleuren": "Toelichting kleuren",
+        "modules_vragenlijst": "Modules Vragenlijst",
+        "default_choices": ("Ja", "Nee"),
+        "ga_naar": "Ga naar",
+        "vraag": "vraag naar",
+        "module": "module",
+        "module_sectie": "module sectie",
+        "globaal_aantal_vragen": "Globaal aantal vragen",
+        "aantal_vragen_per_module": "Aantal vragen per module",
+        "vragen_alleen_main": "Vragen alleen main",
+        "alle_vragen": "Alle vragen",
+        "modules": "Modules",
+        "category": "Categorie",
+        "aantal": "Aantal",
+    },
+    "english": {
+        "toelichting_vragen": "Explanation questions",
+        "toelichting_kleuren": "Explanation colours",
+        "modules_vragenlijst": "Modules Questionnaire",
+        "default_choices": ("Yes", "No"),
+        "ga_naar": "Go to",
+        "vraag": "question",
+        "module": "module",
+        "module_sectie": "module section",
+        "globaal_aantal_vragen": "Overall number of questions",
+        "aantal_vragen_per_module": "Number of questions per module",
+        "vragen_alleen_main": "Questions Main only",
+        "alle_vragen": "All questions",
+        "modules": "Modules",
+        "category": "Category",
+        "aantal": "Number",
+    },
+}
+
+LANGUAGES = tuple(LABELS.keys())
 
 
 class DocumentLabels:
+    # vaste attributen in plaats van een __dict__ per instantie
+    __slots__ = ("language",) + tuple(LABELS["dutch"].keys())
+
     def __init__(self, language):
         self.language = language
 
-        self.toelichting_vragen = None
-        self.toelichting_kleuren = None
-        self.default_choices = None
-        self.modules_vragenlijst = None
-        self.ga_naar = None
-        self.vraag = None
-        self.module = None
-        self.module_sectie = None
-        self.globaal_aantal_vragen = None
-        self.aantal_vragen_per_module = None
-        self.vragen_alleen_main = None
-        self.alle_vragen = None
-        self.modules = None
-        self.category = None
-        self.aantal = None
-
-        if self.language == "dutch":
-            self.set_labels_dutch()
-        elif self.language == "english":
-            self.set_labels_english()
-        else:
-            raise AssertionError(f"Language must be one of {LANGUAGES}")
-
-    def set_labels_dutch(self):
-        self.toelichting_vragen = "Toelichting vragen"
-        self.toelichting_kleuren = "Toelichting kleuren"
-        self.modules_vragenlijst = "Modules Vragenlijst"
-        self.default_choices = ["Ja", "Nee"]
-        self.ga_naar = "Ga naar"
-        self.vraag = "vraag naar"
-        self.module = "module"
-        self.module_sectie = "module sectie"
-        self.globaal_aantal_vragen = "Globaal aantal vragen"
-        self.aantal_vragen_per_module = "Aantal vragen per module"
-        self.vragen_alleen_main = "Vragen alleen main"
-        self.alle_vragen = "Alle vragen"
-        self.modules = "Modules"
-        self.category = "Categorie"
-        self.aantal = "Aantal"
+        labels = LABELS.get(language)
+        if labels is None:
+            raise ValueError(f"Language must be one of {LANGUAGES}")
 
-    def set_labels_english(self):
-        self.toelichting_vragen = "Explanation questions"
-        self.toelichting_kleuren = "Explanation colours"
-        self.default_choices = ["Yes", "No"]
-        self.modules_vragenlijst = "Modules Questionnaire"
-        self.ga_naar = "Go to"
-        self.vraag = "question"
-        self.module = "module"
-        self.module_sectie = "module section"
-        self.globaal_aantal_vragen = "Overall number of questions"
-        self.aantal_vragen_per_module = "Number of questions per module"
-        self.vragen_alleen_main = "Questions Main only"
-        self.alle_vragen = "All questions"
-        self.modules = "Modules"
-        self.category = "Category"
-        self.aantal = "Number"
+        for name, label in labels.items():
+            setattr(self, name, label)
@@ -1,10 +1,17 @@
 """
 Some aid classes and function for the latex environment
 """
+import functools
 import re
 from pylatex.base_classes import Environment, CommandBase
 
+# characters which are removed from the module section labels
+MODULE_SECTION_SKIP_CHARS = re.compile(r"_|\s|/")
 
+
+# the labels only depend on their argument, so they can be cached. The module label is for
+# instance needed again for every row of the summary table
+@functools.lru_cache(maxsize=None)
 def label_module_section(title):
     """
     Create a label to use for referring to a module section
@@ -21,7 +28,7 @@ def label_module_section(title):
 
     """
 
-    return re.sub("_|\s|/", "", ":".join(["modsec", title.lower()]))
+    return MODULE_SECTION_SKIP_CHARS.sub("", f"modsec:{title.lower()}")
 
 
 def label_question(key):
@@ -38,9 +45,10 @@ def label_question(key):
     str:
         quest:key
     """
-    return ":".join(["quest", key])
+    return f"quest:{key}"
 
 
+@functools.lru_cache(maxsize=None)
 def label_module(key):
     """
     Create a label to use for referring to a module
@@ -55,110 +63,94 @@ def label_module(key):
     str:
         mod:key, where all the underscores are removed from the key as this is also done by Label
     """
-    return re.sub("_", "", ":".join(["mod", key]))
+    return f"mod:{key}".replace("_", "")
 
 
-class Itemize(Environment):
+class RawEnvironment(Environment):
+    """
+    Environment of which the content is not escaped and put on separate lines
+    """
     escape = False
     content_separator = "\n"
 
 
-class Tabular(Environment):
-    _latex_name = "tabular"
+class RawCommand(CommandBase):
+    """
+    Command of which the arguments are not escaped
+    """
     escape = False
     content_separator = "\n"
 
 
+class Itemize(RawEnvironment):
+    _latex_name = "itemize"
+
+
+class Tabular(RawEnvironment):
+    _latex_name = "tabular"
+
+
 class InfoEnvironment(Environment):
     _latex_name = "info"
 
 
-class Questionnaire(Environment):
+class Questionnaire(RawEnvironment):
     """
     The main environment questionnairy which encapsulates all the questions
     """
     _latex_name = "questionnaire"
-    escape = False
-    content_separator = "\n"
 
 
-class QuantityQuestion(Environment):
+class QuantityQuestion(RawEnvironment):
     _latex_name = "markgroup"
-    escape = False
-    content_separator = "\n"
 
 
-class ChoiceQuestion(Environment):
+class ChoiceQuestion(RawEnvironment):
     _latex_name = "choicequestion"
-    escape = False
-    content_separator = "\n"
 
 
-class Colorize(Environment):
+class Colorize(RawEnvironment):
     _latex_name = "colorize"
-    escape = False
-    content_separator = "\n"
 
 
 class Empty(Environment):
     omit_if_empty = True
 
 
-class ChoiceGroupQuestion(Environment):
+class ChoiceGroupQuestion(RawEnvironment):
     _latex_name = "choicegroup"
-    escape = False
-    content_separator = "\n"
 
 
-class ChoiceRangeGroupQuestion(Environment):
+class ChoiceRangeGroupQuestion(RawEnvironment):
     _latex_name = "markgroup"
-    escape = False
-    content_separator = "\n"
 
-class ChoiceItemText(CommandBase):
+
+class ChoiceItemText(RawCommand):
     _latex_name = "choiceitemtext"
-    escape = False
-    content_separator = "\n"
 
 
-class ChoiceItem(CommandBase):
+class ChoiceItem(RawCommand):
     _latex_name = "choiceitem"
-    escape = False
-    content_separator = "\n"
 
 
-class ChoiceLine(CommandBase):
+class ChoiceLine(RawCommand):
     _latex_name = "choiceline"
-    escape = False
-    content_separator = "\n"
 
 
-class GroupChoice(CommandBase):
+class GroupChoice(RawCommand):
     _latex_name = "groupaddchoice"
-    escape = False
-    content_separator = "\n"
 
 
-class MarkLine(CommandBase):
+class MarkLine(RawCommand):
     _latex_name = "markline"
-    escape = False
-    content_separator = "\n"
 
 
-class TextBox(CommandBase):
+class TextBox(RawCommand):
     _latex_name = "textbox*"
-    escape = False
-    content_separator = "\n"
 
 
-class SingleMark(CommandBase):
+class SingleMark(RawCommand):
     _latex_name = "singlemark"
-    escape = False
-    content_separator = "\n"
-
-
-class AddInfo(CommandBase):
-    _latex_name = "addinfo"
 
 
 class AddInfo(CommandBase):
@@ -173,10 +165,8 @@ class NewLine(CommandBase):
     _latex_name = "newline"
 
 
-class Appendix(CommandBase):
+class Appendix(RawCommand):
     _latex_name = "section*"
-    escape = False
-    content_separator = "\n"
 
 
 class VSpace(CommandBase):
@@ -7,19 +7,14 @@ Usage:
 """
 
 import argparse
-import collections
+import functools
 import logging
 import os
-import re
-import subprocess
 import sys
 from pathlib import Path
 
-import yaml
-import yamlloader
 from datetime import datetime
 
-from survey_maker.engine import SurveyMaker
 from survey_maker.utils import Chdir
 
 try:
@@ -29,11 +24,13 @@ except ModuleNotFoundError:
 
 logger = logging.getLogger()
 
+# the handlers which setup_logging has added to the root logger
+_LOG_HANDLERS = list()
 
-def _parse_the_command_line_arguments(args):
-    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    # parse the command line to set some options2
-    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+@functools.lru_cache(maxsize=1)
+def _get_parser():
+    """Build the command line parser once and reuse it for every call to main"""
     parser = argparse.ArgumentParser(
         description="Create a survey  from a yaml file",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
@@ -207,12 +204,51 @@ def _parse_the_command_line_arguments(args):
         help="Do not print out the author in the pdf file",
     )
 
+    return parser
+
+
+def _parse_the_command_line_arguments(args):
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # parse the command line to set some options2
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    parser = _get_parser()
+
     # parse the command line
     parsed_arguments = parser.parse_args(args)
 
     return parsed_arguments, parser
 
 
+def get_git_output(working_directory, *git_arguments):
+    """
+    Run a git command and return its output
+
+    Parameters
+    ----------
+    working_directory: str
+        Directory in which the git command is run
+    git_arguments: str
+        The arguments passed to git, e.g. "describe", "--tags"
+
+    Returns
+    -------
+    str:
+        The decoded standard output of the git command
+    """
+    import subprocess
+
+    # the error output of git is not used, so do not create a pipe for it
+    process = subprocess.run(
+        ["git", *git_arguments],
+        cwd=working_directory,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        check=False,
+    )
+    return process.stdout
+
+
 def get_version(default_version=None):
     """
     Get the current git version of this questionnaire
@@ -222,19 +258,16 @@ def get_version(default_version=None):
     str:
         current git version
     """
-    process = subprocess.Popen(
-        ["git", "describe", "--tags"], stdout=subprocess.PIPE, stderr=subprocess.PIPE
-    )
-    stat1, stat2 = process.communicate()
-    if stat1.decode() == "":
+    stat1 = get_git_output(os.getcwd(), "describe", "--tags")
+    if stat1 == "":
         logger.info(
             "No git version found in questionnaire folder. Is it under git control?"
         )
         survey_version = default_version
-        logger.info("Overruling with version in yaml file: {}".format(survey_version))
+        logger.info("Overruling with version in yaml file: %s", survey_version)
     else:
-        survey_version = stat1.decode().strip()
-        logger.info("Survey version found: {}".format(stat1.decode()))
+        survey_version = stat1.strip()
+        logger.info("Survey version found: %s", stat1)
 
     return survey_version
 
@@ -253,27 +286,17 @@ def get_branch(default_branch=None):
     str:
         current branch version
     """
-    process = subprocess.Popen(
-        ["git", "branch", "--no-color"], stdout=subprocess.PIPE, stderr=subprocess.PIPE
-    )
-    stat1, stat2 = process.communicate()
-    git_branch = stat1.decode().strip()
-    branch_list = git_branch.split("\n")
-
-    survey_branch = default_branch
+    # rev-parse gives the name of the active branch directly, or HEAD for a detached head
+    git_branch = get_git_output(os.getcwd(), "rev-parse", "--abbrev-ref", "HEAD").strip()
 
-    if not branch_list:
+    if git_branch in ("", "HEAD"):
         logger.info(
-            "No git version found in questionnaire folder. Is it under git control?"
+            "No git branch found in questionnaire folder. Is it under git control?"
         )
-        logger.info("Overruling with version in yaml file: {}".format(survey_branch))
+        survey_branch = default_branch
+        logger.info("Overruling with branch in yaml file: %s", survey_branch)
     else:
-        for branch in branch_list:
-            # deze regex matcht de actieve branch (met de * voor de branch naam)
-            match = re.match("\*\s(.*)", branch)
-            if bool(match):
-                survey_branch = match.group(1)
-                break
+        survey_branch = git_branch
 
     return survey_branch
 
@@ -282,11 +305,10 @@ def reorganize_colors(colorize_questions, main_color):
     """
     Change the order of the colors
 
-    :param colorize_questions: OrderedDict
+    :param colorize_questions: dict with the colorize properties
     :param main_color: Name of the main color
-    :return: New OrderedDict
+    :return: New dict with the main color first. The input dict is not changed
     """
-    new_colorize_order = collections.OrderedDict()
     try:
         color_properties = colorize_questions[main_color]
     except KeyError:
@@ -294,21 +316,46 @@ def reorganize_colors(colorize_questions, main_color):
             "Color '{}' was not defined in the colorize properties.\nPlease pick "
             "one of: {}".format(main_color, list(colorize_questions.keys()))
         )
-    else:
-        logger.debug("Adding colorize {}".format(main_color))
-        new_colorize_order[main_color] = color_properties
-        new_colorize_order[main_color]["add_this"] = True
-        new_colorize_order[main_color]["apply_color"] = True
-        for color_key, color_properties in colorize_questions.items():
-            if color_key == main_color:
-                continue
-            else:
-                logger.debug("Adding colorize {}".format(color_key))
-                new_colorize_order[color_key] = color_properties
+
+    new_colorize_order = {
+        main_color: {**color_properties, "add_this": True, "apply_color": True},
+        **{key: props for key, props in colorize_questions.items() if key != main_color},
+    }
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("New colorize order: %s", list(new_colorize_order.keys()))
 
     return new_colorize_order
 
 
+def read_settings(settings_file):
+    """
+    Read the yaml settings file
+
+    Parameters
+    ----------
+    settings_file: str
+        Name of the yaml file with the survey settings
+
+    Returns
+    -------
+    dict:
+        The settings of the survey
+    """
+    # imported here, such that --help and --version do not need to load the yaml parser
+    import yaml
+
+    settings_path = Path(settings_file)
+
+    # pass the binary stream, the yaml reader detects the encoding and reads the file in chunks,
+    # so the whole file is never held in memory next to the parsed settings. The plain dicts of
+    # the safe loader keep the order of the yaml file, so no OrderedDict loader is needed
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with settings_path.open("rb") as stream:
+        settings = yaml.load(stream, Loader=loader)
+
+    return settings
+
+
 def setup_logging(loglevel):
     """Setup basic logging
 
@@ -316,27 +363,46 @@ def setup_logging(loglevel):
       loglevel (int): minimum loglevel for emitting messages
     """
     logformat = "%(levelname)-8s [%(filename)s:%(lineno)4d] %(message)s"
-    logging.basicConfig(
-        level=loglevel, stream=sys.stdout, format=logformat, datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    formatter = logging.Formatter(logformat, datefmt="%Y-%m-%d %H:%M:%S")
+
+    # remove the handlers of a previous call to main, otherwise each record is written once
+    # more for every call
+    root_logger = logging.getLogger()
+    while _LOG_HANDLERS:
+        handler = _LOG_HANDLERS.pop()
+        root_logger.removeHandler(handler)
+        handler.close()
+
+    if root_logger.handlers:
+        # the logging was already set up by the application calling main. Leave it alone, as
+        # logging.basicConfig does
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    root_logger.addHandler(stream_handler)
+    _LOG_HANDLERS.append(stream_handler)
+    root_logger.setLevel(loglevel)
 
 
 def main(args_in):
     args, parser = _parse_the_command_line_arguments(args_in)
 
+    # the engine pulls in pylatex, so only import it once we know we are going to build a survey
+    from survey_maker.engine import SurveyMaker
+
     setup_logging(loglevel=args.log_level)
 
     script_name = os.path.basename(sys.argv[0])
     start_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    message = "Start {script} (v: {version}) at {start_time}:\n{cmd}".format(
-        script=script_name, version=__version__, start_time=start_time, cmd=sys.argv[:]
+    logger.info(
+        "Start %s (v: %s) at %s:\n%s", script_name, __version__, start_time, sys.argv[:]
     )
-    logger.info(message)
     # read the yaml file and put the whole structure into a dictionary: *settings*
-    logger.info("Reading settings file {}".format(args.survey_settings))
-    logger.debug("Current location: {}".format(os.getcwd()))
-    with open(args.survey_settings, "r", encoding="utf-8") as stream:
-        settings = yaml.load(stream=stream, Loader=yamlloader.ordereddict.CLoader)
+    logger.info("Reading settings file %s", args.survey_settings)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Current location: %s", os.getcwd())
+    settings = read_settings(args.survey_settings)
 
     general = settings["general"]
     working_directory = general.get("working_directory", ".")
@@ -345,7 +411,7 @@ def main(args_in):
     colorize_questions = general.get("colorize_questions")
 
     if colorize_questions is not None and args.color is not None:
-        logger.info("Setting {} as main color".format(args.color))
+        logger.info("Setting %s as main color", args.color)
         colorize_questions = reorganize_colors(colorize_questions, args.color)
 
     if colorize_questions is not None and args.no_color is not None:
@@ -353,8 +419,8 @@ def main(args_in):
             colorize_questions[args.no_color]["add_this"] = False
         except KeyError as err:
             logger.warning(
-                f"Could not find definition of color you are trying to turn of: "
-                f"{args.no_color}"
+                "Could not find definition of color you are trying to turn of: %s",
+                args.no_color,
             )
             raise KeyError(err)
 
@@ -414,13 +480,20 @@ def main(args_in):
                 # underscores give problems in latex, so replace with dash
                 survey_branch = survey_branch.replace("_", "")
                 # only add the branch name if we have o ne
-                output_file = "_".join([output_file, re.sub("-.*", "", survey_branch)])
+                output_file = f"{output_file}_{survey_branch.partition('-')[0]}"
                 if survey_version is not None:
                     survey_version = survey_branch + "-" + survey_version
+        else:
+            survey_branch = None
 
         if survey_version is not None:
-            version = re.sub("^-", "", re.sub(survey_branch, "", survey_version))
-            output_file = "_".join([output_file, "v" + re.sub("-.*", "", version)])
+            version = survey_version
+            if survey_branch is not None:
+                # remove the branch name we have put in front of the version above
+                version = version.replace(survey_branch, "", 1)
+                if version.startswith("-"):
+                    version = version[1:]
+            output_file = f"{output_file}_v{version.partition('-')[0]}"
 
         if not args.no_date:
             date = preamble.get("date")
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
-import collections
 import logging
+import re
 import string
 import time
+from collections import Counter
 
 from pylatex import (Document, Section, Command)
 from pylatex.package import Package
@@ -11,8 +12,7 @@ from pylatex.utils import NoEscape
 from survey_maker.latex_classes import *
 from survey_maker.labels import DocumentLabels
 
-QUESTION_TYPES = ["quantity", "choices", "group", "textbox", "range", "rangegroup"]
-SPECIAL_KEYS = ("fontsize", "above")
+SPECIAL_KEYS = frozenset(("fontsize", "above"))
 
 COUNT_QUST_KEY = "questions"
 COUNT_MODULES_KEY = "modules"
@@ -20,6 +20,36 @@ COUNT_QUST_TOTAL_KEY = "questions_incl_choices"
 
 DVZ_KEY = "dvz"
 
+# a goto to a module label starts with mod
+MODULE_GOTO = re.compile(r"^mod")
+WHITE_SPACE = re.compile(r"\s+")
+# the explanation at the end of a question, which is moved behind the review reference
+EXPLANATION = re.compile(r"(explanation.*$)")
+
+# the a), b), ... labels in front of the lines of a group question, also in the colorline version
+CHAR_LABELS = tuple(f"{char})" for char in string.ascii_lowercase)
+COLORLINE_CHAR_LABELS = tuple(f"\\colorline{{{char})}}" for char in string.ascii_lowercase)
+
+# the vertical space added between the blocks
+PARSKIP = NoEscape(r"\parskip")
+
+# the cbs colors, written to the preamble as one block. The items of the preamble are separated
+# by %\n, so use the same separator here
+COLOR_DEFINITIONS = NoEscape("%\n".join([
+    r"\definecolor{cbsblauw}{RGB}{39, 29, 108}",
+    r"\definecolor{cbslichtblauw}{RGB}{0, 161, 205}",
+    r"\definecolor{oranje}{RGB}{243, 146, 0}",
+    r"\definecolor{oranjevergrijsd}{RGB}{206, 124, 0}",
+    r"\definecolor{rood}{RGB}{233, 76, 10}",
+    r"\definecolor{roodvergrijsd}{RGB}{178, 61, 2}",
+    r"\definecolor{codekleur}{RGB}{88, 88, 88}",
+]))
+
+# definitions of the section commands added to the preamble
+SECTION_WITH_LABEL = NoEscape(r"\phantomsection #1\def\@currentlabel{\unexpanded{#1}}\label{#2}")
+# the filbreak makes sure that you do net get a lonely header at the bottom of the page
+MODULE_SECTION = NoEscape(r"\filbreak{\sectionwithlabel{\textbf{#1}}{#2}}")
+
 logger = logging.getLogger()
 
 
@@ -141,25 +171,27 @@ class SurveyDocument(Document):
             ligatures = NoEscape(r"Ligatures={Common,TeX}")
             numbers = NoEscape(r"Numbers={Lining}")
             scale = NoEscape(r"Scale=MatchLowercase")
-            self.preamble.append(Package("fontspec"))
-            self.preamble.append(Command("setmainfont", "Calibri",
-                                         options=[ligatures, numbers]))
-            self.preamble.append(Command("setmonofont", "Consolas",
-                                         options=[ligatures, scale]))
-            self.preamble.append(Command("setsansfont", "Cambria", options=[ligatures]))
-            self.preamble.append(Command(r"newfontfamily\serif", "Cambria"))
+            self.preamble.extend([
+                Package("fontspec"),
+                Command("setmainfont", "Calibri", options=[ligatures, numbers]),
+                Command("setmonofont", "Consolas", options=[ligatures, scale]),
+                Command("setsansfont", "Cambria", options=[ligatures]),
+                Command(r"newfontfamily\serif", "Cambria"),
+            ])
 
         if draft:
-            self.preamble.append(Package("background"))
-            self.preamble.append(Command("backgroundsetup", NoEscape(
-                r"position=current page.north west,"
-                r"angle=0,"
-                r"nodeanchor=north west,"
-                r"vshift=-2 mm,"
-                r"hshift=2 mm,"
-                r"opacity=1,"
-                r"scale=3,"
-                r"contents=Draft")))
+            self.preamble.extend([
+                Package("background"),
+                Command("backgroundsetup", NoEscape(
+                    r"position=current page.north west,"
+                    r"angle=0,"
+                    r"nodeanchor=north west,"
+                    r"vshift=-2 mm,"
+                    r"hshift=2 mm,"
+                    r"opacity=1,"
+                    r"scale=3,"
+                    r"contents=Draft")),
+            ])
 
         if hyphenation is not None:
             word_list = NoEscape(" ".join(hyphenation))
@@ -168,80 +200,100 @@ class SurveyDocument(Document):
         date_and_version = ""
         if survey_date != "":
             if survey_date is None:
-                date_and_version += "{}\\\\".format(NoEscape(r"\today"))
+                date_and_version += r"\today\\"
             else:
-                date_and_version += "{}\\\\".format(survey_date)
+                date_and_version += f"{survey_date}\\\\"
 
         if survey_version is not None:
-            date_and_version += "{}".format(survey_version)
+            date_and_version += f"{survey_version}"
 
-        self.preamble.append(Command("title", title))
-        if author is not None:
-            self.preamble.append(Command("author", NoEscape(author)))
-        self.preamble.append(Command("date", NoEscape(date_and_version)))
-        self.preamble.append(Package("booktabs"))
-        self.preamble.append(Package("tocloft"))
-        self.preamble.append(Command("makeatletter"))
         if survey_version is not None:
-            self.preamble.append(
-                Command("chead[]", NoEscape(r"\@title\\Version {}".format(survey_version))))
+            chead = NoEscape(rf"\@title\\Version {survey_version}")
         else:
-            self.preamble.append(Command("chead[]", NoEscape(r"\@title")))
-        self.preamble.append(
-            Command(r"newcommand{\sectionwithlabel}[2]",
-                    NoEscape(r"\phantomsection #1\def\@currentlabel{\unexpanded{#1}}\label{#2}")))
-
-        self.preamble.append(Command("makeatother"))
-        self.preamble.append(Command(r"newcommand\supscript[1]", NoEscape(r"{$^{\textrm{#1}}$}")))
-        self.preamble.append(Command(r"newcommand\subscript[1]", NoEscape(r"{$_{\textrm{#1}}$}")))
-        self.preamble.append(Command(r"newcommand\explanation[1]",
-                                     NoEscape(r"\newline\footnotesize{\emph{#1}}")))
-
-        # the filbreak makes sure that you do net get a lonely header at the bottom of the page
-        section_str = r"\filbreak{\sectionwithlabel{\textbf{#1}}{#2}}"
-        self.preamble.append(Command(r"newcommand\modulesection[2]", NoEscape(section_str)))
-
-        self.preamble.append(Command("setcounter{tocdepth}", "1"))
-        self.preamble.append(Command(
-            NoEscape(r"addto\captionsdutch{\renewcommand{\contentsname}{\Large\textbf{"
-                     r"Modules Vragenlijst}}}")))
+            chead = NoEscape(r"\@title")
+
+        # collect the title block and the custom commands and add them in one go
+        preamble_commands = [Command("title", title)]
+        if author is not None:
+            preamble_commands.append(Command("author", NoEscape(author)))
+        preamble_commands.extend([
+            Command("date", NoEscape(date_and_version)),
+            Package("booktabs"),
+            Package("tocloft"),
+            Command("makeatletter"),
+            Command("chead[]", chead),
+            Command(r"newcommand{\sectionwithlabel}[2]", SECTION_WITH_LABEL),
+            Command("makeatother"),
+            Command(r"newcommand\supscript[1]", NoEscape(r"{$^{\textrm{#1}}$}")),
+            Command(r"newcommand\subscript[1]", NoEscape(r"{$_{\textrm{#1}}$}")),
+            Command(r"newcommand\explanation[1]", NoEscape(r"\newline\footnotesize{\emph{#1}}")),
+            Command(r"newcommand\modulesection[2]", MODULE_SECTION),
+            Command("setcounter{tocdepth}", "1"),
+            Command(NoEscape(r"addto\captionsdutch{\renewcommand{\contentsname}{\Large\textbf{"
+                             r"Modules Vragenlijst}}}")),
+        ])
+        self.preamble.extend(preamble_commands)
 
         self.questionnaire = questionnaire
 
         self.global_label_width = global_label_width
         self.global_box_width = global_box_width
 
-        self.append(Command("maketitle"))
-        self.append(Command("tableofcontents*"))
-        self.append(Command("newpage"))
-        self.append(Command("appendix"))
+        self.extend([
+            Command("maketitle"),
+            Command("tableofcontents*"),
+            Command("newpage"),
+            Command("appendix"),
+        ])
 
         self.prune_colors = prune_colors
 
         if colorize_questions is not None:
             # the colorize keys are stored in a dictionary
             self.colorize_properties = colorize_questions
-            self.main_color = list(self.colorize_properties.keys())[0]
+            self.main_color = next(iter(self.colorize_properties))
         else:
             self.colorize_properties = dict()
             self.main_color = None
 
-        self.preamble.append(Command(
+        # the review and dvz flags do not change anymore, so select the colors which are used in
+        # this document only once
+        self._active_colorize_items = tuple(
+            (ckey, cprop) for ckey, cprop in self.colorize_properties.items()
+            if self.process_this_colorize(cprop))
+        self._active_colorize_keys = frozenset(ckey for ckey, _ in self._active_colorize_items)
+        # the latex color command per color key, used for the refers to labels
+        self._color_commands = {ckey: "\\color" + ckey.replace("_", "")
+                                for ckey, _ in self._active_colorize_items}
+        self._subtract_flags = {
+            ckey: cprop.get("subtract_count_from_total", False)
+            for ckey, cprop in self.colorize_properties.items()}
+        # the colors which get a counter per module. Note that this only checks the add_this flag
+        self._active_count_keys = tuple(
+            ckey for ckey, cprop in self.colorize_properties.items()
+            if cprop.get("add_this", True) and ckey != DVZ_KEY)
+        # the names of the counters as reported in the summary, see get_name_of_key
+        self._key_names = {
+            COUNT_QUST_KEY: self.labels.vragen_alleen_main,
+            COUNT_QUST_TOTAL_KEY: self.labels.alle_vragen,
+            COUNT_MODULES_KEY: self.labels.modules,
+        }
+        for ckey, cprop in self.colorize_properties.items():
+            self._key_names.setdefault(ckey, cprop.get("label", ckey))
+        # without a match the get_colorize_properties, get_color_first_match and
+        # get_refers_to_label methods return the last colorize key, as before
+        if self.colorize_properties:
+            self._last_colorize_key = list(self.colorize_properties.keys())[-1]
+        else:
+            self._last_colorize_key = None
+
+        self.preamble.extend([
             # this line changes the title of the table of contents
-            NoEscape(r"addto\captionsdutch{\renewcommand{\contentsname}{\Large\textbf{"
-                     f"{self.labels.modules_vragenlijst}"
-                     r"}}}")))
-
-        self.preamble.append(Command(NoEscape(r"definecolor{cbsblauw}{RGB}{39, 29, 108}")))
-        self.preamble.append(Command(NoEscape(r"definecolor{cbslichtblauw}{RGB}{0, 161, 205}")))
-        self.preamble.append(Command(NoEscape(r"definecolor{oranje}{RGB}{243, 146, 0}")))
-        self.preamble.append(Command(NoEscape(
-            r"definecolor{oranjevergrijsd}{RGB}{206, 124, 0}")))
-        self.preamble.append(Command(NoEscape(r"definecolor{rood}{RGB}{233, 76, 10}")))
-        self.preamble.append(Command(NoEscape(
-            r"definecolor{roodvergrijsd}{RGB}{178, 61, 2}")))
-        self.preamble.append(Command(NoEscape(
-            r"definecolor{codekleur}{RGB}{88, 88, 88}")))
+            Command(NoEscape(r"addto\captionsdutch{\renewcommand{\contentsname}{\Large\textbf{"
+                             f"{self.labels.modules_vragenlijst}"
+                             r"}}}")),
+            COLOR_DEFINITIONS,
+        ])
 
         # these attributes get the properties of the first colorize item
         self.colorize_key = None
@@ -249,12 +301,16 @@ class SurveyDocument(Document):
         self.colorline = None
         self.colorize_color = None
 
+        # the redirection strings of the filters per goto label, as a filter is often checked
+        # for every choice of a question
+        self._redirection_strings = dict()
+
         # initialise the counter with one counter for the total already
         init_count = {COUNT_MODULES_KEY: 0,
                       COUNT_QUST_KEY: 0,
                       COUNT_QUST_TOTAL_KEY: 0}
-        self.counts = collections.Counter(init_count)
-        self.counts_per_module = collections.OrderedDict()
+        self.counts = Counter(init_count)
+        self.counts_per_module = dict()
 
         self.create_color_latex_command()
 
@@ -272,7 +328,7 @@ class SurveyDocument(Document):
                 try:
                     info_for_color = info_items_per_color[self.main_color]
                 except KeyError:
-                    logger.info(f"No info color defined for {self.main_color}")
+                    logger.info("No info color defined for %s", self.main_color)
                 else:
                     if isinstance(info_for_color, list):
                         items = info_for_color
@@ -281,7 +337,7 @@ class SurveyDocument(Document):
                     add_info_items["items"].extend(items)
                     added_items = True
             if added_items:
-                self.append(VSpace(NoEscape(r"\parskip")))
+                self.append(VSpace(PARSKIP))
                 self.append(ModuleSection([NoEscape(f"{self.labels.toelichting_vragen}"),
                                            "toelichting"]))
                 self.add_info(add_info_items, fontsize="normalsize")
@@ -299,36 +355,31 @@ class SurveyDocument(Document):
 
     def remove_packages(self, packages_to_exclude: list):
         """ remove the packages in *package_to_exclude* from the preamble """
-        package_to_remove = list()
-        for package in self.packages:
-            arguments = package.arguments._positional_args
-            if arguments[0] in packages_to_exclude:
-                package_to_remove.append(package)
-        self.packages = self.packages.difference(package_to_remove)
+        to_exclude = set(packages_to_exclude)
+        package_to_remove = [package for package in self.packages
+                             if package.arguments._positional_args[0] in to_exclude]
+        # the packages of the document are an instance attribute, so remove them in place
+        self.packages.difference_update(package_to_remove)
 
     def write_colorize_explanation(self):
         """ Get the explanation field of all colorize items and add to the list of items """
 
-        if self.colorize_properties is not None:
-            have_any_color = False
-            for col_key, col_prop in self.colorize_properties.items():
-                if self.process_this_colorize(col_prop):
-                    have_any_color = True
-
-            if have_any_color:
-                self.append(VSpace(NoEscape(r"\parskip")))
-                self.append(ModuleSection([NoEscape(self.labels.toelichting_kleuren), "kleuren"]))
-                with self.create(Itemize()):
-                    for col_key, col_prop in self.colorize_properties.items():
-                        if not self.process_this_colorize(col_prop):
-                            continue
-                        try:
-                            explanation = col_prop["explanation"]
-                        except KeyError:
-                            logger.debug("No explanation added to {}".format(col_key))
-                        else:
-                            cmd = f"\\color{col_key}" + "{" + explanation + "}"
-                            self.write_info(NoEscape(cmd), is_item=True)
+        explanations = list()
+        for col_key, col_prop in self._active_colorize_items:
+            explanation = col_prop.get("explanation")
+            if explanation is None:
+                logger.debug("No explanation added to %s", col_key)
+            else:
+                explanations.append(f"\\color{col_key}{{{explanation}}}")
+
+        # only add the section if there is something to explain, as an empty itemize is not
+        # allowed in latex
+        if explanations:
+            self.append(VSpace(PARSKIP))
+            self.append(ModuleSection([NoEscape(self.labels.toelichting_kleuren), "kleuren"]))
+            with self.create(Itemize()):
+                for cmd in explanations:
+                    self.write_info(NoEscape(cmd), is_item=True)
 
     def make_report(self):
         """ Report the counts of the questions """
@@ -337,100 +388,91 @@ class SurveyDocument(Document):
             self.append(Command("clearpage"))
             self.append(Command("setcounter", arguments=["secnumdepth", 0]))
             self.append(Section(title=self.summary_title,
-                                label=NoEscape(re.sub(r"\s+", "_", self.summary_title).lower())))
+                                label=NoEscape(WHITE_SPACE.sub("_", self.summary_title).lower())))
             self.create_summary_table()
 
         logger.info("Counts")
         for key, count in self.counts.items():
             name = self.get_name_of_key(key)
-            logger.info("{:20s} : {}".format(name, count))
+            logger.info("%-20s : %s", name, count)
 
     def create_summary_table(self):
         """
         Create two latex tables with all the count of the modules and questions
         """
+        # local names for the attributes used in the loops below. Note that self.append also
+        # works inside the self.create blocks, as it looks up the current data at each call
+        append = self.append
+        counts = self.counts
+        subtract_flags = self._subtract_flags
+        questionnaire = self.questionnaire
+        get_name_of_key = self.get_name_of_key
 
-        self.append(ModuleSection([NoEscape(self.labels.globaal_aantal_vragen), "global"]))
-        self.append(Command("newline"))
+        append(ModuleSection([NoEscape(self.labels.globaal_aantal_vragen), "global"]))
+        append(Command("newline"))
 
         with self.create(Tabular(arguments="ll")):
-            self.append(Command("toprule"))
-            self.append(r"\textbf{"
+            append(Command("toprule"))
+            append(r"\textbf{"
                         f"{self.labels.category}"
                         r"}&\textbf{"
                         f"{self.labels.aantal}"
                         r"}\\")
-            self.append(Command("midrule"))
-            for key, count in self.counts.items():
+            append(Command("midrule"))
+            for key, count in counts.items():
                 if key == COUNT_QUST_KEY:
                     # do not report the number of main questions, only including the sub questions
                     continue
-                try:
-                    col_prop = self.colorize_properties[key]
-                except KeyError:
-                    subtract_count_from_total = False
-                else:
-                    # in case the subtract_count_from_total key is defined, report the difference
-                    # with the total. Usefull to report to total 'Kleine bedrijven' from the count
-                    # of bedrijven where the kleine bedrijven are excluded
-                    subtract_count_from_total = col_prop.get("subtract_count_from_total", False)
-
-                if subtract_count_from_total:
-                    number = self.counts[COUNT_QUST_TOTAL_KEY] - count
+                # in case the subtract_count_from_total key is defined, report the difference
+                # with the total. Usefull to report to total 'Kleine bedrijven' from the count
+                # of bedrijven where the kleine bedrijven are excluded
+                if subtract_flags.get(key, False):
+                    number = counts[COUNT_QUST_TOTAL_KEY] - count
                 else:
                     number = count
 
-                name = self.get_name_of_key(key)
-                self.append(f"{name} & {number}\\\\")
-            self.append(Command("bottomrule"))
+                name = get_name_of_key(key)
+                append(f"{name} & {number}\\\\")
+            append(Command("bottomrule"))
 
-        self.append(Command("newline"))
+        append(Command("newline"))
 
-        self.append(ModuleSection([NoEscape(self.labels.aantal_vragen_per_module), "permodule"]))
-        self.append(Command("newline"))
+        append(ModuleSection([NoEscape(self.labels.aantal_vragen_per_module), "permodule"]))
+        append(Command("newline"))
         # minus 2 because we do not report the modules and not the main questions
-        n_categories = len(list(self.counts.keys())) - 2
+        n_categories = len(counts) - 2
         tabular = "l" + "l" * n_categories
         with self.create(Tabular(arguments=tabular)):
-            self.append(Command("toprule"))
-            header = "\\textbf{Module}"
-            for key, cnt in self.counts.items():
+            append(Command("toprule"))
+            header = ["\\textbf{Module}"]
+            for key, cnt in counts.items():
                 if key in (COUNT_MODULES_KEY, COUNT_QUST_KEY):
                     continue
-                name = self.get_name_of_key(key)
-                header += (" & " + name)
-            header += "\\\\"
-            self.append(header)
-            self.append(Command("midrule"))
+                name = get_name_of_key(key)
+                header.append(" & " + name)
+            header.append("\\\\")
+            append("".join(header))
+            append(Command("midrule"))
+            # the columns and their subtract flags are the same for each module
+            columns = [(m_key, subtract_flags.get(m_key, False))
+                       for m_key in counts.keys()
+                       if m_key not in (COUNT_MODULES_KEY, COUNT_QUST_KEY)]
             for key, module_count in self.counts_per_module.items():
-                line = "\\ref{" + "{}".format(label_module(key)) + "} "
-                line += self.questionnaire[key]["title"]
-                for m_key in self.counts.keys():
-                    if m_key in (COUNT_MODULES_KEY, COUNT_QUST_KEY):
-                        continue
-
-                    try:
-                        col_prop = self.colorize_properties[m_key]
-                    except KeyError:
-                        subtract_count_from_total = False
-                    else:
-                        subtract_count_from_total = col_prop.get("subtract_count_from_total", False)
-
-                    try:
-                        value = module_count[m_key]
-                    except KeyError:
-                        value = 0
+                line = [f"\\ref{{{label_module(key)}}} ",
+                        questionnaire[key]["title"]]
+                for m_key, subtract_count_from_total in columns:
+                    value = module_count.get(m_key, 0)
 
                     if subtract_count_from_total:
                         number = module_count[COUNT_QUST_TOTAL_KEY] - value
                     else:
                         number = value
 
-                    line += (" & " + "{}".format(number))
-                line += "\\\\"
-                self.append(line)
+                    line.append(f" & {number}")
+                line.append("\\\\")
+                append("".join(line))
 
-            self.append(Command("bottomrule"))
+            append(Command("bottomrule"))
 
     def get_name_of_key(self, key):
         """
@@ -445,22 +487,13 @@ class SurveyDocument(Document):
         -------
         str:
             The name of the quantity belong to the key
-        """
 
-        if key == COUNT_QUST_KEY:
-            name = self.labels.vragen_alleen_main
-        elif key == COUNT_QUST_TOTAL_KEY:
-            name = self.labels.alle_vragen
-        elif key == COUNT_MODULES_KEY:
-            name = self.labels.modules
-        else:
-            colorize_prop = self.colorize_properties[key]
-            try:
-                name = colorize_prop["label"]
-            except KeyError:
-                name = key
+        Notes
+        -----
+        The names are collected once in *__init__*, so this is just a lookup
+        """
 
-        return name
+        return self._key_names[key]
 
     def create_color_latex_command(self):
         """
@@ -468,47 +501,42 @@ class SurveyDocument(Document):
 
         Notes
         -----
-        The color properties are stored in an Ordered dict 'self.colorize_properties'. The
+        The color properties are stored in the dict 'self.colorize_properties'. The
         first item in this dict is the main color which is assigned to a question, even of
         more colors are related to the same question
         """
 
-        for col_key, col_prop in self.colorize_properties.items():
-            # for each key in the colorize chapter create a latex color command
+        if self._active_colorize_items:
+            # the first color is used for the colorline command and the colorize environment
+            col_key, col_prop = self._active_colorize_items[0]
+            self.colorize_color = col_prop["color"]
+            self.colorize_key = col_key
+            self.colorize_label = col_prop.get("label")
+            self.colorline = col_prop.get("label")
 
-            if not self.process_this_colorize(col_prop):
-                continue
+            self.preamble.extend([
+                # create a new command for setting the color of a single line
+                Command(r"newcommand\colorline[1]",
+                        NoEscape(rf"{{{{\color{{{self.colorize_color}}}{{#1}}}}}}")),
+                # create a new environment for setting the color in a block
+                Command(r"newenvironment{colorize}[1][" +
+                        self.colorize_color +
+                        r"]{\medskip\bgroup\color{#1}}{\egroup\medskip}"),
+            ])
+
+        for col_key, col_prop in self._active_colorize_items:
+            # for each key in the colorize chapter create a latex color command
 
-            if re.search("_", col_key):
+            if "_" in col_key:
                 raise ValueError("No _ allowed in the color keys")
 
             if col_key != DVZ_KEY:
-                self.counts.update({col_key: 0})
+                self.counts[col_key] = 0
 
             color_name = col_prop["color"]
 
-            color_command = Command(r"newcommand\color" + col_key + "[1]",
-                                    NoEscape(r"{{\color{" + r"{:}".format(color_name) + r"}{#1}}}"))
-
-            if self.colorize_key is None:
-                self.colorize_color = color_name
-                self.colorize_key = col_key
-                self.colorize_label = col_prop.get("label")
-                self.colorline = col_prop.get("label")
-
-                # create a new command for setting the color of a single line
-                self.preamble.append(Command(r"newcommand\colorline[1]",
-                                             NoEscape(r"{{\color{" +
-                                                      r"{:}".format(self.colorize_color) +
-                                                      r"}{#1}}}")))
-
-                # create a new environment for setting the color in a block
-                self.preamble.append(Command(
-                    r"newenvironment{colorize}[1][" +
-                    color_name +
-                    r"]{\medskip\bgroup\color{#1}}{\egroup\medskip}"))
-
-            self.preamble.append(color_command)
+            self.preamble.append(Command(r"newcommand\color" + col_key + "[1]",
+                                         NoEscape(rf"{{{{\color{{{color_name}}}{{#1}}}}}}")))
 
     def process_this_colorize(self, color_prop):
         """
@@ -558,25 +586,25 @@ class SurveyDocument(Document):
                     # always add all modules if you are pruning and have the prune color
                     add_this = True
                 else:
-                    logger.debug(f"Skipping module {module_key}:  {self.main_color} != {color_key}")
+                    logger.debug("Skipping module %s:  %s != %s", module_key, self.main_color,
+                                 color_key)
                     continue
 
             if not add_this:
-                logger.debug("Skipping section {}".format(module_key))
+                logger.debug("Skipping section %s", module_key)
                 continue
 
             # add one to the counter of the modules
             if not exclude_from_count:
-                self.counts.update({"modules": 1})
+                self.counts["modules"] += 1
 
                 # initialise the counter of the questions per module to zero
                 init_count = {"questions": 0, "questions_incl_choices": 0}
-                self.counts_per_module[module_key] = collections.Counter(init_count)
-                for ckey, cprop in self.colorize_properties.items():
-                    if cprop.get("add_this", True) and ckey != DVZ_KEY:
-                        self.counts_per_module[module_key].update({ckey: 0})
+                self.counts_per_module[module_key] = Counter(init_count)
+                for ckey in self._active_count_keys:
+                    self.counts_per_module[module_key][ckey] = 0
 
-            logger.info("Adding module {}".format(module_key))
+            logger.info("Adding module %s", module_key)
 
             self.append(Command("clearpage"))
 
@@ -609,13 +637,12 @@ class SurveyDocument(Document):
             and label a prefix add to the goto
         """
 
-        ckey = None
-        color_name = None
-        goto = None
-        label = None
-        for ckey, cprop in self.colorize_properties.items():
-            if not self.process_this_colorize(cprop):
-                continue
+        if self._active_colorize_keys.isdisjoint(module_properties):
+            # most modules do not have a color key at all
+            return self._last_colorize_key, None, None, None
+
+        # loop in the order of the colors, as the first color in this order wins
+        for ckey, cprop in self._active_colorize_items:
             if module_properties.get(ckey):
                 color_name = cprop["color"]
                 label = cprop.get("goto_condition_label")
@@ -626,9 +653,9 @@ class SurveyDocument(Document):
                 # it is interpreted as a goto reference which needs to be reported.
                 goto = module_properties[ckey]
                 # stop checking the other keys in case we have found the first
-                break
+                return ckey, color_name, goto, label
 
-        return ckey, color_name, goto, label
+        return self._last_colorize_key, None, None, None
 
     def add_module(self, module_key, module_properties, goto_properties=None, module_color_key=None,
                    module_color_name=None, module_color_label=None, exclude_from_count=False):
@@ -670,14 +697,11 @@ class SurveyDocument(Document):
             # A goto string is passed to the module. Prepend a Ga naar label before we start with
             # this module
             if module_color_label is not None:
-                if re.match("^mod", goto):
+                if MODULE_GOTO.match(goto):
                     # remove all underscores for mod: reference
-                    goto = re.sub("_", "", goto)
-                ref_str = f"{module_color_label}" + \
-                          " $\\rightarrow$ " \
-                          f"{self.labels.ga_naar} " \
-                          "\\textbf{\\ref{" + \
-                          goto + "}}"
+                    goto = goto.replace("_", "")
+                ref_str = (f"{module_color_label} $\\rightarrow$ {self.labels.ga_naar} "
+                           f"\\textbf{{\\ref{{{goto}}}}}")
                 with self.create(InfoEnvironment()):
                     self.append(Command("normalsize", NoEscape(ref_str)))
 
@@ -703,28 +727,29 @@ class SurveyDocument(Document):
             else:
                 color_local, color_key = module_color_name, module_color_key
             if exclude_question and not question_properties.get(color_key):
-                logger.debug(f"skipping {key} due to exclude")
+                logger.debug("skipping %s due to exclude", key)
                 continue
 
             # als de color_local als veld in de properties gegeven is en op false staat (default is
             # True) dan slaan we deze vraag over
             if self.prune_colors and not question_properties.get(color_key, True):
-                logger.debug("Skip question {}".format(key))
+                logger.debug("Skip question %s", key)
                 continue
 
-            logger.info("Adding question {}".format(key))
-
             # if a section title field is given, start a new section title at this question
             section = question_properties.get("section")
             if self.prune_colors and section is not None and not section.get(self.main_color, True):
-                logger.debug(f"Turning off info for section: {section}")
+                logger.debug("Turning off info for section: %s", section)
                 section = None
             if section:
                 ref_str = None
                 color_all_in_section = False
-                for ckey, cprop in self.colorize_properties.items():
-                    if not self.process_this_colorize(cprop) or module_color_key is not None:
-                        continue
+                if module_color_key is None:
+                    section_colorize_items = self._active_colorize_items
+                else:
+                    # the color of the module is used for the whole section
+                    section_colorize_items = ()
+                for ckey, cprop in section_colorize_items:
                     goto = section.get(ckey)
                     if goto is None:
                         continue
@@ -732,19 +757,17 @@ class SurveyDocument(Document):
                     label = cprop.get("label")
 
                     if isinstance(goto, str):
-                        if re.match("^mod", goto):
+                        if MODULE_GOTO.match(goto):
                             # remove all underscores for mod: reference
-                            goto = re.sub("_", "", goto)
+                            goto = goto.replace("_", "")
                         if label is not None:
-                            ref_str = f"{label}" + \
-                                      " $\\rightarrow$ " \
-                                      f"{self.labels.ga_naar} " \
-                                      "\\textbf{\\ref{" + goto + "}}"
+                            ref_str = (f"{label} $\\rightarrow$ {self.labels.ga_naar} "
+                                       f"\\textbf{{\\ref{{{goto}}}}}")
                     break
 
                 title = section["title"]
                 title_label = label_module_section(title)
-                self.append(VSpace(NoEscape("\parskip")))
+                self.append(VSpace(PARSKIP))
 
                 if color_all_in_section:
                     with self.create(Colorize(options=color_all_in_section)):
@@ -760,7 +783,7 @@ class SurveyDocument(Document):
 
                 info = section.get("info")
                 if info is not None:
-                    self.append(VSpace(NoEscape("\parskip")))
+                    self.append(VSpace(PARSKIP))
                     if color_all_in_section:
                         with self.create(Colorize(options=color_all_in_section)):
                             self.add_info(info)
@@ -769,19 +792,16 @@ class SurveyDocument(Document):
 
             add_this = question_properties.get("add_this", True)
             if not add_this:
-                logger.debug("Skip question {}".format(key))
+                logger.debug("Skip question %s", key)
                 continue
 
-            logger.info("Adding question {}".format(key))
-            if module_color_key is None:
-                color_local, color_key = self.get_color_first_match(question_properties)
-            else:
-                color_local, color_key = module_color_name, module_color_key
+            logger.info("Adding question %s", key)
             if self.prune_colors:
-                if color_key == self.main_color and question_properties.get(color_key, True):
-                    logger.debug(f"adding main color question {key}  {color_key}")
+                # questions with the color key set to false have already been skipped above
+                if color_key == self.main_color:
+                    logger.debug("adding main color question %s  %s", key, color_key)
                 else:
-                    logger.debug(f"skipping {key}")
+                    logger.debug("skipping %s", key)
                     continue
             refers_to_label, refers_to_key = self.get_refers_to_label(question_properties)
             if color_local or color_all_in_section:
@@ -797,40 +817,52 @@ class SurveyDocument(Document):
                 n_question = self.add_question(key, question_properties, filter_prop,
                                                refers_to_label)
 
-            logger.debug("Count and keys {} {} {}".format(n_question, color_key, refers_to_key))
+            logger.debug("Count and keys %s %s %s", n_question, color_key, refers_to_key)
 
             # the refers to key may have a count field set to overrule the true
             # count. Check that here, and if so, impose it
-            try:
-                count = question_properties[refers_to_key]["count"]
-            except (KeyError, TypeError):
+            refers_to_properties = question_properties.get(refers_to_key)
+            if isinstance(refers_to_properties, dict):
+                count = refers_to_properties.get("count")
+            else:
+                count = None
+            if count is None:
                 # if count was not set, just continue
-                logger.debug("Keeping count: {} ".format(n_question))
+                logger.debug("Keeping count: %s ", n_question)
             else:
-                logger.info("Changing count: {} -> {}".format(n_question, count))
+                logger.info("Changing count: %s -> %s", n_question, count)
                 n_question = count
 
+            # which of the optional counters apply only depends on the keys found above
+            apply_color_count = color_local is not None and color_key != DVZ_KEY
+            apply_refers_count = refers_to_label is not None and refers_to_key != color_key
+            apply_increase = increase_counter is not None
+
             if not exclude_from_count:
-                self.counts.update({COUNT_QUST_KEY: 1})
-                self.counts_per_module[module_key].update({COUNT_QUST_KEY: 1})
+                counts = self.counts
+                module_counts = self.counts_per_module[module_key]
+
+                counts[COUNT_QUST_KEY] += 1
+                module_counts[COUNT_QUST_KEY] += 1
 
-                self.counts.update({"questions_incl_choices": n_question})
-                self.counts_per_module[module_key].update({"questions_incl_choices": n_question})
+                counts[COUNT_QUST_TOTAL_KEY] += n_question
+                module_counts[COUNT_QUST_TOTAL_KEY] += n_question
 
-                if color_local is not None and color_key != DVZ_KEY:
-                    self.counts.update({color_key: n_question})
-                    self.counts_per_module[module_key].update({color_key: n_question})
-                if refers_to_label is not None and refers_to_key != color_key:
-                    self.counts.update({refers_to_key: n_question})
-                    self.counts_per_module[module_key].update({refers_to_key: n_question})
+                # the color keys below do not need to have a counter yet; the Counter starts at zero
+                if apply_color_count:
+                    counts[color_key] += n_question
+                    module_counts[color_key] += n_question
+                if apply_refers_count:
+                    counts[refers_to_key] += n_question
+                    module_counts[refers_to_key] += n_question
 
-                if increase_counter is not None:
+                if apply_increase:
                     # this allow to increase the counter of one extra feature in case the
                     # 'increase_counter' key is defined in a question
-                    self.counts.update({COUNT_QUST_TOTAL_KEY: 1})
-                    self.counts_per_module[module_key].update({COUNT_QUST_TOTAL_KEY: 1})
-                    self.counts.update({increase_counter: 1})
-                    self.counts_per_module[module_key].update({increase_counter: 1})
+                    counts[COUNT_QUST_TOTAL_KEY] += 1
+                    module_counts[COUNT_QUST_TOTAL_KEY] += 1
+                    counts[increase_counter] += 1
+                    module_counts[increase_counter] += 1
 
     def get_refers_to_label(self, question_properties):
         """
@@ -847,19 +879,17 @@ class SurveyDocument(Document):
             label with the reference and color of the question
 
         """
-        refers_to = None
-        ckey = None
-        for ckey, cprop in self.colorize_properties.items():
+        for ckey, cprop in self._active_colorize_items:
             have_key = question_properties.get(ckey)
-            if have_key and isinstance(have_key, dict) and self.process_this_colorize(cprop):
+            if have_key and isinstance(have_key, dict):
                 refers_to = have_key.get("refers_to")
                 if refers_to is not None:
-                    label = self.colorize_properties[ckey]["label"]
-                    cc = "\color{}".format(re.sub("_", "", ckey))
-                    ll = "({}: $\\rightarrow$ ".format(label) + "{" + refers_to + "})"
-                    refers_to = cc + "{" + ll + "}"
-                    break  # stop after the first color you find
-        return refers_to, ckey
+                    label = cprop["label"]
+                    cc = self._color_commands[ckey]
+                    refers_to = f"{cc}{{({label}: $\\rightarrow$ {{{refers_to}}})}}"
+                    return refers_to, ckey  # stop after the first color you find
+        # no reference found: return the last colorize key, as the full loop used to do
+        return None, self._last_colorize_key
 
     def get_color_first_match(self, question_properties):
         """
@@ -875,18 +905,16 @@ class SurveyDocument(Document):
         str:
             None or the name of the matched color
         """
-        color = None
-        ckey = None
-        for ckey, cprop in self.colorize_properties.items():
-            have_key = question_properties.get(ckey)
-            if have_key and self.process_this_colorize(cprop):
-                apply = self.colorize_properties[ckey].get("apply_color", True)
+        for ckey, cprop in self._active_colorize_items:
+            if question_properties.get(ckey):
+                apply = cprop.get("apply_color", True)
                 if apply:
-                    color = self.colorize_properties[ckey]["color"]
+                    color = cprop["color"]
                 else:
                     color = "black"
-                break  # stop after the first color you find
-        return color, ckey
+                return color, ckey  # stop after the first color you find
+        # no color found: return the last colorize key, as the full loop used to do
+        return None, self._last_colorize_key
 
     def add_question(self, key, question_properties, filter_prop=None, refers_to_label=None):
         """
@@ -929,104 +957,48 @@ class SurveyDocument(Document):
             dvz_above = False
             dvz_color = None
         if self.prune_colors and info is not None and not info.get(self.main_color, True):
-            logger.debug(f"Turning off info for question: {question}")
+            logger.debug("Turning off info for question: %s", question)
             info = None
 
-        if question_type not in QUESTION_TYPES:
-            logger.info("question type {} not yet implemented. Skipping".format(question_type))
-            return
+        handler = self._QUESTION_HANDLERS.get(question_type)
+        if handler is None:
+            raise ValueError(f"Question type {question_type} of question {key} not implemented. "
+                             f"Must be one of {sorted(self._QUESTION_HANDLERS)}")
 
         if self.review_references and refers_to_label:
-            match = re.search("(explanation.*$)", question)
-            if bool(match):
+            match = EXPLANATION.search(question)
+            if match is not None:
                 expl = match.group(1)
-                # als er haken in de explanation zitten moeten we ze speciaal maken
-                expl2 = expl.replace("(", "\(").replace(")", "\)")
-                question = re.sub(expl2, "", question)
-                question = re.sub("\\\\$", "", question)
+                # knip de explanation eraf, inclusief de backslash van het commando
+                question = question[:match.start()]
+                if question.endswith("\\"):
+                    question = question[:-1]
             else:
                 expl = None
-            question += " \emph{" + refers_to_label + "}"
+            question += f" \\emph{{{refers_to_label}}}"
             if expl is not None:
-                question += ("\\" + expl)
+                question += f"\\{expl}"
 
-        n_questions = 1
-
-        logger.debug("Checking quantity_type : {}".format(question_type))
         if question_type == "quantity":
-            quantity_label = question_properties.get("quantity_label", "")
-            if isinstance(quantity_label, str) and quantity_label != "":
-                # append a :  in case the label of the quantity is not empty
-                quantity_label += ":"
-            box_width = question_properties.get("box_width", self.global_box_width)
-            with self.create(QuantityQuestion(arguments=NoEscape(question))):
-                if info is not None and above:
-                    logger.warning("Above option in info not possible for quantity question! "
-                                   "Put this info box below")
-                    above = False
-                if dvz is not None and dvz_above:
-                    logger.warning("Above option in dvz not possible for quantity question! "
-                                   "Put this info box below")
-                    dvz_above = False
-                n_questions = self.add_quantity_question(key, quantity_label, box_width=box_width,
-                                                         filter_properties=filter_prop)
-        elif question_type == "choices":
-            logger.debug("Adding a choice question")
-            choices = question_properties.get("choices")
-            number_of_columns = question_properties.get("number_of_columns", 1)
-            with self.create(ChoiceQuestion(options=[number_of_columns],
-                                            arguments=NoEscape(question))):
-                if dvz is not None and dvz_above:
-                    with self.create(Colorize(options=dvz_color)):
-                        self.add_info(dvz)
-                if info is not None and above:
-                    self.add_info(info)
-                self.add_choice_question(key, choices, filter_prop)
-
-        elif question_type == "group":
-            logger.debug("Adding a group question")
-            group_width = question_properties.get("group_width")
-            groups = question_properties.get("groups", ["Ja", "Nee"])
-            choice_lines = question_properties["choicelines"]
-            with self.create(ChoiceGroupQuestion(arguments=NoEscape(question))):
-                if dvz is not None and dvz_above:
-                    with self.create(Colorize(options=dvz_color)):
-                        self.add_info(dvz)
-                if info is not None and above:
-                    self.add_info(info)
-                n_questions = self.add_choice_group_question(key, groups, choice_lines, group_width,
-                                                             filter_prop)
-        elif question_type == "textbox":
-            text_width = question_properties.get("textbox", "1cm")
-            if dvz is not None and dvz_above:
-                with self.create(Colorize(options=dvz_color)):
-                    self.add_info(dvz)
+            # the quantity environment can not hold an info box above the question
             if info is not None and above:
-                self.add_info(info)
-            self.add_textbox_question(key, question, text_width)
-        elif question_type == "range":
-            range_items = question_properties["range_labels"]
+                logger.warning("Above option in info not possible for quantity question! "
+                               "Put this info box below")
+                above = False
             if dvz is not None and dvz_above:
-                with self.create(Colorize(options=dvz_color)):
-                    self.add_info(dvz)
-            if info is not None and above:
-                self.add_info(info)
-            self.add_range_question(key, question, range_items)
-        elif question_type == "rangegroup":
-            question_lines = question_properties["question_lines"]
-            range_labels = question_properties["range_labels"]
-
-            with self.create(ChoiceRangeGroupQuestion(arguments=NoEscape(question))):
-                if dvz is not None and dvz_above:
-                    with self.create(Colorize(options=dvz_color)):
-                        self.add_info(dvz)
-                if info is not None and above:
-                    self.add_info(info)
-                n_questions = self.add_range_group_question(question_lines=question_lines,
-                                                            range_items=range_labels)
-        else:
-            raise AssertionError("question type not known. Check if type of question {} is one of "
-                                 "the following: {} ".format(key, QUESTION_TYPES))
+                logger.warning("Above option in dvz not possible for quantity question! "
+                               "Put this info box below")
+                dvz_above = False
+
+        # the dvz and info blocks which need to be written above the question
+        info_above = list()
+        if dvz is not None and dvz_above:
+            info_above.append((dvz, dvz_color))
+        if info is not None and above:
+            info_above.append((info, None))
+
+        logger.debug("Checking quantity_type : %s", question_type)
+        n_questions = handler(self, key, question, question_properties, filter_prop, info_above)
 
         if info is not None and not above:
             self.add_info(info)
@@ -1036,26 +1008,110 @@ class SurveyDocument(Document):
 
         return n_questions
 
+    def add_info_above(self, info_above):
+        """
+        Add the info blocks which are placed above the question
+
+        Parameters
+        ----------
+        info_above: list
+            List of (info, color) tuples. In case color is not None, the info block is colorized
+        """
+        for info, color in info_above:
+            if color is not None:
+                with self.create(Colorize(options=color)):
+                    self.add_info(info)
+            else:
+                self.add_info(info)
+
+    def _create_quantity_question(self, key, question, question_properties, filter_prop,
+                                  info_above):
+        quantity_label = question_properties.get("quantity_label", "")
+        if isinstance(quantity_label, str) and quantity_label != "":
+            # append a :  in case the label of the quantity is not empty
+            quantity_label += ":"
+        box_width = question_properties.get("box_width", self.global_box_width)
+        with self.create(QuantityQuestion(arguments=NoEscape(question))):
+            n_questions = self.add_quantity_question(key, quantity_label, box_width=box_width,
+                                                     filter_properties=filter_prop)
+        return n_questions
+
+    def _create_choice_question(self, key, question, question_properties, filter_prop,
+                                info_above):
+        logger.debug("Adding a choice question")
+        choices = question_properties.get("choices")
+        number_of_columns = question_properties.get("number_of_columns", 1)
+        with self.create(ChoiceQuestion(options=[number_of_columns],
+                                        arguments=NoEscape(question))):
+            self.add_info_above(info_above)
+            self.add_choice_question(key, choices, filter_prop)
+        return 1
+
+    def _create_group_question(self, key, question, question_properties, filter_prop,
+                               info_above):
+        logger.debug("Adding a group question")
+        group_width = question_properties.get("group_width")
+        groups = question_properties.get("groups", ["Ja", "Nee"])
+        choice_lines = question_properties["choicelines"]
+        with self.create(ChoiceGroupQuestion(arguments=NoEscape(question))):
+            self.add_info_above(info_above)
+            n_questions = self.add_choice_group_question(key, groups, choice_lines, group_width,
+                                                         filter_prop)
+        return n_questions
+
+    def _create_textbox_question(self, key, question, question_properties, filter_prop,
+                                 info_above):
+        text_width = question_properties.get("textbox", "1cm")
+        self.add_info_above(info_above)
+        self.add_textbox_question(key, question, text_width)
+        return 1
+
+    def _create_range_question(self, key, question, question_properties, filter_prop,
+                               info_above):
+        range_items = question_properties["range_labels"]
+        self.add_info_above(info_above)
+        self.add_range_question(key, question, range_items)
+        return 1
+
+    def _create_range_group_question(self, key, question, question_properties, filter_prop,
+                                     info_above):
+        question_lines = question_properties["question_lines"]
+        range_labels = question_properties["range_labels"]
+        with self.create(ChoiceRangeGroupQuestion(arguments=NoEscape(question))):
+            self.add_info_above(info_above)
+            n_questions = self.add_range_group_question(question_lines=question_lines,
+                                                        range_items=range_labels)
+        return n_questions
+
+    # the method creating the question for each question type
+    _QUESTION_HANDLERS = {
+        "quantity": _create_quantity_question,
+        "choices": _create_choice_question,
+        "group": _create_group_question,
+        "textbox": _create_textbox_question,
+        "range": _create_range_question,
+        "rangegroup": _create_range_group_question,
+    }
+
     def add_range_group_question(self, question_lines, range_items):
 
-        items = list()
-        for cnt, item in enumerate(range_items):
-            if cnt == 2:
-                logger.warning("Only two range items allowed")
-                break
-            items.append(NoEscape(item))
+        if len(range_items) > 2:
+            logger.warning("Only two range items allowed")
+        items = [NoEscape(item) for item in range_items[:2]]
 
         n_questions = 0
 
-        for cnt, line in enumerate(question_lines):
-            char = string.ascii_lowercase[cnt] + ")"
-            if re.search("colorline", line):
+        append = self.append
+        if len(question_lines) > len(CHAR_LABELS):
+            raise ValueError(f"At most {len(CHAR_LABELS)} lines allowed in a range group")
+        for char, colorline_char, line in zip(CHAR_LABELS, COLORLINE_CHAR_LABELS, question_lines):
+            if "colorline" in line:
                 # in case we color the line, do the same for the character
-                char = "\colorline{" + char + "}"
-            line_with_char = "\\textbf{" + char + "} " + line
+                char = colorline_char
+            line_with_char = f"\\textbf{{{char}}} {line}"
 
             args = [NoEscape(line_with_char)] + items
-            self.append(MarkLine(args))
+            append(MarkLine(args))
             n_questions += 1
 
         return n_questions
@@ -1073,12 +1129,9 @@ class SurveyDocument(Document):
         range_items:
             list of strings to mark the lower and upper range
         """
-        single_mark_arguments = [NoEscape(question)]
-        for cnt, item in enumerate(range_items):
-            if cnt == 2:
-                logger.warning("Only two range items allowed")
-                break
-            single_mark_arguments.append(NoEscape(item))
+        if len(range_items) > 2:
+            logger.warning("Only two range items allowed")
+        single_mark_arguments = [NoEscape(question)] + [NoEscape(item) for item in range_items[:2]]
 
         self.append(SingleMark(arguments=single_mark_arguments))
 
@@ -1104,13 +1157,14 @@ class SurveyDocument(Document):
         """
         Add a group choice question
         """
+        append = self.append
 
         for group in groups:
             if group_width is not None:
-                grp = "\parbox{" + "{}".format(group_width) + r"}{\raggedright " + group + "}"
+                grp = f"\\parbox{{{group_width}}}{{\\raggedright {group}}}"
             else:
                 grp = group
-            self.append(GroupChoice(NoEscape(grp)))
+            append(GroupChoice(NoEscape(grp)))
 
         if filter_prop is not None:
             condition = filter_prop["condition"]
@@ -1119,13 +1173,14 @@ class SurveyDocument(Document):
 
         n_questions = 0
 
-        for cnt, line in enumerate(choice_lines):
-            char = string.ascii_lowercase[cnt] + ")"
-            if re.search("colorline", line):
+        if len(choice_lines) > len(CHAR_LABELS):
+            raise ValueError(f"At most {len(CHAR_LABELS)} lines allowed in question {key}")
+        for char, colorline_char, line in zip(CHAR_LABELS, COLORLINE_CHAR_LABELS, choice_lines):
+            if "colorline" in line:
                 # in case we color the line, do the same for the character
-                char = "\colorline{" + char + "}"
-            line_with_char = "\\textbf{" + char + "} " + line
-            self.append(ChoiceLine(NoEscape(line_with_char)))
+                char = colorline_char
+            line_with_char = f"\\textbf{{{char}}} {line}"
+            append(ChoiceLine(NoEscape(line_with_char)))
             n_questions += 1
 
         self.append(Command("label", NoEscape(label_question(key))))
@@ -1153,7 +1208,7 @@ class SurveyDocument(Document):
             with self.create(Colorize(options=color)):
                 with self.create(InfoEnvironment()):
                     self.write_info(info, fontsize=fontsize)
-        self.append(VSpace(NoEscape("\parskip")))
+        self.append(VSpace(PARSKIP))
 
     def write_info(self, info, fontsize="footnotesize", is_item=False):
         """
@@ -1194,12 +1249,6 @@ class SurveyDocument(Document):
         The routine below is recursively calling itself so that in the items can be nested
         """
 
-        try:
-            # in case
-            fsize = info["fontsize"]
-        except (KeyError, TypeError):
-            fsize = fontsize
-
         if isinstance(info, str):
             # info is a string. Create a plot command
             text = Command(fontsize, NoEscape(info))
@@ -1210,6 +1259,8 @@ class SurveyDocument(Document):
                 # it is not a item, which is only the case for the first title string
                 self.append(text)
         elif isinstance(info, dict):
+            # only a dict can overrule the font size
+            fsize = info.get("fontsize", fontsize)
             # we have a dict, loop over its keys and make a recursive call for each item
             for key, value in info.items():
                 if key == "title":
@@ -1234,7 +1285,7 @@ class SurveyDocument(Document):
         elif isinstance(info, list):
             # we have a list. Just added all the items to the itemize environment
             for item in info:
-                self.write_info(item, is_item=True, fontsize=fsize)
+                self.write_info(item, is_item=True, fontsize=fontsize)
         else:
             raise AssertionError("Only valid for str, dict or list")
 
@@ -1258,28 +1309,46 @@ class SurveyDocument(Document):
             if filter_prop["condition"] == choice or choice is None:
                 goto_properties = filter_prop["goto"]
                 goto = get_goto_reference(goto_properties, main_color)
-                ref_cat = goto.split(":")[0]
-                if ref_cat == "quest":
-                    category = self.labels.vraag
-                elif ref_cat == "mod":
-                    category = self.labels.module
-                elif ref_cat == "modsec":
-                    category = self.labels.module_sectie
-                else:
-                    category = None
+                redirect_str = self._redirection_strings.get(goto)
+                if redirect_str is None:
+                    redirect_str = self.create_redirection_string(goto)
+                    self._redirection_strings[goto] = redirect_str
 
-                # rmove all _ as they are not allowed in latex
-                if ref_cat != "quest":
-                    goto = re.sub("_", "", goto)
+        return redirect_str
 
-                if category is not None:
-                    redirect_str = "$\\rightarrow$ " \
-                                   f"{self.labels.ga_naar} " \
-                                   + category + " \\ref{" + goto + "}"
-                else:
-                    # in case we can not find a sensible fit, add the whole goto string
-                    redirect_str = "$\\rightarrow$ " \
-                                   f"{self.labels.ga_naar} " + goto
+    def create_redirection_string(self, goto):
+        """
+        Create the redirection string for a goto label
+
+        Parameters
+        ----------
+        goto: str
+            The label to go to, e.g. quest:key or mod:key
+
+        Returns
+        -------
+        str:
+            A string to redirect to a new question
+        """
+        ref_cat = goto.split(":")[0]
+        if ref_cat == "quest":
+            category = self.labels.vraag
+        elif ref_cat == "mod":
+            category = self.labels.module
+        elif ref_cat == "modsec":
+            category = self.labels.module_sectie
+        else:
+            category = None
+
+        # rmove all _ as they are not allowed in latex
+        if ref_cat != "quest":
+            goto = goto.replace("_", "")
+
+        if category is not None:
+            redirect_str = f"$\\rightarrow$ {self.labels.ga_naar} {category} \\ref{{{goto}}}"
+        else:
+            # in case we can not find a sensible fit, add the whole goto string
+            redirect_str = f"$\\rightarrow$ {self.labels.ga_naar} {goto}"
 
         return redirect_str
 
@@ -1302,12 +1371,13 @@ class SurveyDocument(Document):
         else:
             choice_labels = choices
 
+        append = self.append
         for cnt, choice in enumerate(choice_labels):
             redirection_str = self.get_redirection_string_for_filter(filter_prop, choice,
                                                                      self.main_color)
             ch_str = choice + redirection_str
 
-            self.append(ChoiceItem(NoEscape(ch_str)))
+            append(ChoiceItem(NoEscape(ch_str)))
 
         self.append(Command("label", NoEscape(label_question(key))))
 
@@ -1348,19 +1418,22 @@ class SurveyDocument(Document):
             width = label_width
 
         n_questions = 0
-        for cnt, label in enumerate(label_list):
+        append = self.append
+        if len(label_list) > len(string.ascii_lowercase):
+            raise ValueError(f"At most {len(string.ascii_lowercase)} labels allowed in "
+                             f"question {key}")
+        for char, label in zip(string.ascii_lowercase, label_list):
             if isinstance(quantity_label, list):
-                char = string.ascii_lowercase[cnt]
-                label_with_char = "\\textbf{" + char + "}) " + label
+                label_with_char = f"\\textbf{{{char}}}) {label}"
                 # treat as a list of labels
-                lbl = "\\parbox{0.92\\textwidth}{" + label_with_char + "}"
+                lbl = f"\\parbox{{0.92\\textwidth}}{{{label_with_char}}}"
             else:
                 if label_width is not None:
-                    lbl = "\\parbox{" + "{}".format(width) + "}{" + label + "}"
+                    lbl = f"\\parbox{{{width}}}{{{label}}}"
                 else:
                     lbl = label
 
-            self.append(ChoiceItemText(arguments=["1.2em", box_width, NoEscape(lbl)]))
+            append(ChoiceItemText(arguments=["1.2em", box_width, NoEscape(lbl)]))
             n_questions += 1
 
         if n_questions == 0:
@@ -1375,3 +1448,7 @@ class SurveyDocument(Document):
             self.add_info(condition + redirection_str)
 
         return n_questions
+
+
+# the supported question types are the ones with a handler in SurveyDocument
+QUESTION_TYPES = frozenset(SurveyDocument._QUESTION_HANDLERS)
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+import os
+from shutil import copy2
+
+from survey_maker.engine import style_file_is_current
+
+__author__ = "Eelco van Vliet"
+__copyright__ = "CBS"
+__license__ = "mit"
+
+
+def test_style_file_is_current(tmp_path):
+    src_style_file = tmp_path / "sdaps.cls"
+    src_style_file.write_text("% sdaps class\n")
+    dest_style_file = tmp_path / "output" / "sdaps.cls"
+    dest_style_file.parent.mkdir()
+
+    assert not style_file_is_current(src_style_file, dest_style_file)
+
+    copy2(src_style_file, dest_style_file)
+    assert style_file_is_current(src_style_file, dest_style_file)
+
+    # an upgraded package gives the style file a new modification time
+    stat = src_style_file.stat()
+    os.utime(src_style_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert not style_file_is_current(src_style_file, dest_style_file)
@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from survey_maker.labels import DocumentLabels
+
+__author__ = "Eelco van Vliet"
+__copyright__ = "CBS"
+__license__ = "mit"
+
+
+def test_unknown_language_raises():
+    with pytest.raises(ValueError, match="Language must be one of"):
+        DocumentLabels(language="french")
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import logging
+
+from survey_maker import survey_create
+from survey_maker.survey_create import main, reorganize_colors, setup_logging
+
+__author__ = "Eelco van Vliet"
+__copyright__ = "CBS"
+__license__ = "mit"
+
+SETTINGS = """
+general:
+  preamble:
+    title: Enquête
+    author: CBS
+    version: "2.1"
+    {branch}
+questionnaire:
+  algemeen:
+    title: Algemeen
+    questions:
+      aantal_werknemers:
+        question: Aantal werknemers
+"""
+
+
+def test_no_git_branch_file_name(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "survey.yml").write_text(SETTINGS.format(branch=""), encoding="utf-8")
+
+    main(["survey.yml", "--no_pdf", "--no_git_branch"])
+
+    assert (tmp_path / "survey_v2.1.tex").exists()
+
+
+def test_branch_with_dot_in_file_name(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "survey.yml").write_text(SETTINGS.format(branch="branch: release.2"),
+                                         encoding="utf-8")
+
+    main(["survey.yml", "--no_pdf"])
+
+    assert (tmp_path / "survey_release.2_v2.1.tex").exists()
+
+
+def test_reorganize_colors_puts_main_color_first():
+    colorize_questions = {
+        "groot": {"color": "blue", "add_this": False},
+        "klein": {"color": "red", "add_this": False, "apply_color": False},
+    }
+
+    new_colors = reorganize_colors(colorize_questions, "klein")
+
+    assert list(new_colors.keys()) == ["klein", "groot"]
+    assert new_colors["klein"] == {"color": "red", "add_this": True, "apply_color": True}
+    # the input is left unchanged
+    assert list(colorize_questions.keys()) == ["groot", "klein"]
+    assert colorize_questions["klein"] == {"color": "red", "add_this": False,
+                                           "apply_color": False}
+
+
+def test_setup_logging_twice_keeps_one_handler(monkeypatch):
+    root_logger = logging.getLogger()
+    monkeypatch.setattr(root_logger, "handlers", [])
+    monkeypatch.setattr(root_logger, "level", root_logger.level)
+    monkeypatch.setattr(survey_create, "_LOG_HANDLERS", [])
+
+    setup_logging(logging.INFO)
+    setup_logging(logging.DEBUG)
+
+    assert root_logger.handlers == survey_create._LOG_HANDLERS
+    assert len(root_logger.handlers) == 1
+    assert root_logger.level == logging.DEBUG
+
+
+def test_setup_logging_keeps_existing_configuration(monkeypatch):
+    root_logger = logging.getLogger()
+    handler = logging.NullHandler()
+    monkeypatch.setattr(root_logger, "handlers", [handler])
+    monkeypatch.setattr(root_logger, "level", logging.WARNING)
+    monkeypatch.setattr(survey_create, "_LOG_HANDLERS", [])
+
+    setup_logging(logging.DEBUG)
+
+    assert root_logger.handlers == [handler]
+    assert root_logger.level == logging.WARNING
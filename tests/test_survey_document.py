@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from survey_maker.survey_document import SurveyDocument
+
+__author__ = "Eelco van Vliet"
+__copyright__ = "CBS"
+__license__ = "mit"
+
+
+def make_questionnaire(**extra_modules):
+    questionnaire = {
+        "algemeen": {
+            "title": "Algemeen",
+            "questions": {
+                "aantal_werknemers": {"question": "Aantal werknemers", "type": "quantity"},
+            },
+        },
+    }
+    questionnaire.update(extra_modules)
+    return questionnaire
+
+
+def test_disabled_modules_are_not_checked():
+    """ A disabled module may be incomplete or hold a question type which is not supported """
+    questionnaire = make_questionnaire(
+        draft={"title": "Draft", "add_this": False},
+        toekomst={
+            "title": "Toekomst",
+            "add_this": False,
+            "questions": {
+                "nieuwe_vraag": {"question": "Nog niet ondersteund", "type": "matrix"},
+            },
+        },
+    )
+    document = SurveyDocument(questionnaire=questionnaire, use_cbs_font=False)
+    assert list(document.counts_per_module.keys()) == ["algemeen"]
+
+
+def test_unknown_question_type_raises():
+    questionnaire = make_questionnaire(
+        toekomst={
+            "title": "Toekomst",
+            "questions": {
+                "nieuwe_vraag": {"question": "Nog niet ondersteund", "type": "matrix"},
+            },
+        },
+    )
+    with pytest.raises(ValueError, match="matrix"):
+        SurveyDocument(questionnaire=questionnaire, use_cbs_font=False)